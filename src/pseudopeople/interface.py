@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Union
 
@@ -5,10 +7,10 @@ import numpy as np
 import pandas as pd
 from layered_config_tree import LayeredConfigTree
 from loguru import logger
-from packaging.version import parse
-from tqdm.auto import tqdm
+from packaging.version import Version, parse
 
 from pseudopeople import __version__ as psp_version
+from pseudopeople import progressbar
 from pseudopeople.configuration import get_configuration
 from pseudopeople.constants import paths
 from pseudopeople.constants.metadata import DATEFORMATS
@@ -82,7 +84,7 @@ def _generate_dataset(
         # Iterate sequentially
         noised_dataset = []
         iterator = (
-            tqdm(data_file_paths, desc="Noising data", position=0, leave=False)
+            progressbar.tqdm(data_file_paths, desc="Noising data", position=0, leave=False)
             if len(data_file_paths) > 1
             else data_file_paths
         )
@@ -213,7 +215,15 @@ def validate_source_compatibility(source: Path, dataset: Dataset):
         )
 
 
-def _get_data_changelog_version(changelog):
+def _get_data_changelog_version(changelog: Union[Path, str]) -> Version:
+    # Key the cache on modification time and size so a rewritten changelog
+    # is re-parsed
+    stat = os.stat(changelog)
+    return _parse_data_changelog_version(str(changelog), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_data_changelog_version(changelog: str, mtime_ns: int, size: int) -> Version:
     with open(changelog, "r") as file:
         first_line = file.readline()
     version = parse(first_line.split("**")[1].split("-")[0].strip())
@@ -16,8 +16,8 @@ from typing import Any
 
 import pandas as pd
 from layered_config_tree import LayeredConfigTree
-from tqdm.auto import tqdm
 
+from pseudopeople import progressbar
 from pseudopeople.configuration import Keys
 from pseudopeople.entity_types import ColumnNoiseType, RowNoiseType
 from pseudopeople.noise_entities import NOISE_TYPES
@@ -59,7 +59,7 @@ def noise_dataset(
     missingness = (dataset_data == "") | (dataset_data.isna())
 
     if progress_bar:
-        noise_type_iterator = tqdm(
+        noise_type_iterator = progressbar.tqdm(
             NOISE_TYPES, desc="Applying noise", unit="type", position=1, leave=False
         )
     else:
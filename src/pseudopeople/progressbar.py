@@ -0,0 +1,22 @@
+from typing import Any
+
+__all__ = ["tqdm"]
+
+# tqdm.auto probes for IPython and ipywidgets when imported, so we defer
+# that import until a progress bar is actually requested.
+_tqdm = None
+
+
+def _get_tqdm():
+    global _tqdm
+    if _tqdm is None:
+        from tqdm.auto import tqdm
+
+        _tqdm = tqdm
+    return _tqdm
+
+
+def __getattr__(name: str) -> Any:
+    if name == "tqdm":
+        return _get_tqdm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -50,9 +51,28 @@ def test__get_data_changelog_version(simulated_data_changelog_path):
     ) == parse("1.4.2")
 
 
-def mock_data_version(version, mocker):
+def test__get_data_changelog_version_rereads_modified_changelog(tmp_path):
+    """Test that the cached changelog version is refreshed when the file changes"""
+    changelog = tmp_path / "CHANGELOG.rst"
+    changelog.write_text("**1.4.2 - some date**\n")
+    assert _get_data_changelog_version(changelog) == parse("1.4.2")
+
+    # Same size, so only the modification time distinguishes the rewrite
+    changelog.write_text("**1.4.3 - some date**\n")
+    stat = changelog.stat()
+    os.utime(changelog, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _get_data_changelog_version(changelog) == parse("1.4.3")
+
+    changelog.write_text("**1.4.10 - some later date**\n")
+    assert _get_data_changelog_version(changelog) == parse("1.4.10")
+
+
+@pytest.fixture
+def mock_data_version(request, mocker):
+    """Mocks the version read from the changelog so that it is never read from disk"""
     mocker.patch(
-        "pseudopeople.interface._get_data_changelog_version", return_value=parse(version)
+        "pseudopeople.interface._get_data_changelog_version",
+        return_value=parse(request.param),
     )
 
 
@@ -73,17 +93,17 @@ def test_validate_source_compatibility_no_changelog_error(tmpdir):
 
 
 @pytest.mark.parametrize(
-    "version, match",
+    "mock_data_version, match",
     [
         ("1.4.1", "The simulated population data has been corrupted."),
         ("1.4.3", "A newer version of simulated population data has been provided."),
         ("1.4.12", "A newer version of simulated population data has been provided."),
     ],
+    indirect=["mock_data_version"],
 )
 def test_validate_source_compatibility_bad_version_errors(
-    version, match, simulated_data_changelog_path, mocker
+    mock_data_version, match, simulated_data_changelog_path
 ):
-    mock_data_version(version, mocker)
     with pytest.raises(DataSourceError, match=match):
         validate_source_compatibility(simulated_data_changelog_path, CENSUS)
 
@@ -8,7 +8,7 @@ import pytest
 from layered_config_tree import LayeredConfigTree
 
 from pseudopeople.configuration import Keys
-from pseudopeople.entity_types import ColumnNoiseType
+from pseudopeople.entity_types import ColumnNoiseType, RowNoiseType
 from pseudopeople.interface import (
     generate_american_community_survey,
     generate_current_population_survey,
@@ -356,3 +356,27 @@ def test_two_noise_functions_are_independent(mocker, fuzzy_checker: FuzzyChecker
     # Assert expected order of noise application
     assert noised_data["fake_column_one"].str.contains("123abc").sum() == 0
     assert noised_data["fake_column_two"].str.contains("123abc").sum() == 0
+
+
+@pytest.mark.parametrize("progress_bar", [True, False])
+def test_progress_bar_parameter_controls_tqdm_usage(progress_bar, mocker):
+    """Test that noise_dataset only wraps the noise types in a progress bar
+    when requested
+    """
+    # Not present in the configuration, so the noise function is never called
+    noise_types = [RowNoiseType("sentinel", mocker.Mock())]
+    mocker.patch("pseudopeople.noise.NOISE_TYPES", noise_types)
+    mock_progress_bar = mocker.patch(
+        "pseudopeople.progressbar.tqdm", return_value=noise_types
+    )
+    config = LayeredConfigTree({DATASETS.census.name: {}})
+    data = pd.DataFrame({"a": [1, 2]})
+
+    noise_dataset(DATASETS.census, data, config, 0, progress_bar=progress_bar)
+
+    if progress_bar:
+        mock_progress_bar.assert_called_once_with(
+            noise_types, desc="Applying noise", unit="type", position=1, leave=False
+        )
+    else:
+        mock_progress_bar.assert_not_called()
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+import tqdm.auto
+
+from pseudopeople import progressbar
+
+
+def test_tqdm_auto_is_used_for_jupyter_support():
+    """Test that progress bars use tqdm.auto so they render nicely in notebooks"""
+    assert progressbar.tqdm is tqdm.auto.tqdm
+
+
+def test_tqdm_is_not_imported_with_pseudopeople():
+    """Test that tqdm.auto is only imported once a progress bar is requested"""
+    code = "import sys, pseudopeople.interface; assert 'tqdm.auto' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)